@@ -1,16 +1,47 @@
 import os
+import functools
+import logging
+import threading
+import boto3
+from botocore.config import Config
 from strands.models import BedrockModel
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# 실행 위치(cwd)와 관계없이 이 모듈 옆의 prompts 디렉토리를 사용
+_PROMPT_DIR = Path(__file__).resolve().parent / 'prompts'
+
+@functools.lru_cache(maxsize=None)
+def _read_prompt(prompt: str) -> str:
+    """프롬프트 파일을 읽어 캐시합니다. 파일이 없으면 예외가 발생하므로 실패 결과는 캐시되지 않음
+    (개발 중 프롬프트를 수정했다면 _read_prompt.cache_clear() 로 다시 읽을 수 있음)"""
+    return (_PROMPT_DIR / f'{prompt}.txt').read_text(encoding='utf-8')
+
 def get_agent_prompt(prompt: str) -> str:
+    """prompts/{prompt}.txt 내용을 반환합니다. (프로세스당 한 번만 읽음)"""
     try:
-        with open(f'prompts/{prompt}.txt', 'r', encoding='utf-8') as f:
-            read_prompt = f.read()
+        return _read_prompt(prompt)
     except FileNotFoundError:
-        print(f"Error: {prompt} not found")
-        read_prompt = ""
-    
-    return read_prompt
+        logger.error("Prompt file not found: %s", prompt)
+        return ""
+
+# Bedrock 런타임 클라이언트 공통 설정
+# 에이전트 스레드 풀(최대 8) × 도구 호출 동시성을 감당하도록 연결 풀을 늘리고 keep-alive 유지
+_BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+
+# boto3.Session 은 스레드 안전하지 않으므로 공유 세션에서 클라이언트를 만드는 구간(BedrockModel 생성)을 직렬화
+# (생성된 클라이언트는 스레드 간에 공유해도 안전)
+_MODEL_INIT_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _get_boto_session(region: str) -> boto3.Session:
+    """리전별 boto3 Session 을 하나만 만들어 모든 BedrockModel 이 자격 증명 조회를 공유"""
+    return boto3.Session(region_name=region)
 
 def knowledge_base_config(kb_id, region):
     return {
@@ -19,9 +50,19 @@ def knowledge_base_config(kb_id, region):
         "region": f"{region}"
     }
 
+@functools.lru_cache(maxsize=32)
 def get_configured_model(model_id: str = None) -> BedrockModel:
     """Workshop Bedrock model configuration
     
+    model_id 별로 BedrockModel 을 한 번만 생성해 재사용합니다. 모델 객체는 설정과 boto3 클라이언트만
+    가지고 대화 상태는 Agent 가 보관하므로 여러 Agent 가 동시에 공유해도 안전합니다.
+    (환경변수는 최초 호출 시점의 값이 사용됨)
+    
+    temperature=0 으로 고정하여 동일한 프롬프트에 대해 결정적인 응답을 얻고,
+    BEDROCK_CACHE_PROMPT 환경변수가 설정된 경우 고정된 시스템 프롬프트와 도구 명세 뒤에
+    Bedrock prompt caching 포인트를 추가합니다. (prompt caching 을 지원하는 모델에서만 사용)
+    BEDROCK_STREAMING=true 이면 ConverseStream API 로 응답을 토큰 단위로 받습니다.
+    
     Args:
         model_id: Model ID to use (optional)
         
@@ -39,14 +80,26 @@ def get_configured_model(model_id: str = None) -> BedrockModel:
     # AWS region configuration
     region = os.getenv("AWS_REGION", "ap-northeast-2")
     
+    # Prompt caching (e.g. BEDROCK_CACHE_PROMPT=default)
+    # 시스템 프롬프트와 도구 명세는 요청마다 동일하므로 캐시 대상, 사용자 질의만 매번 달라짐
+    cache_prompt = os.getenv("BEDROCK_CACHE_PROMPT")
+    extra_config = {"cache_prompt": cache_prompt, "cache_tools": cache_prompt} if cache_prompt else {}
+    
+    # Streaming (기본값 off: 도구 결과는 전체 응답이 필요하므로 워크숍 설정 유지)
+    streaming = os.getenv("BEDROCK_STREAMING", "false").lower() in ("1", "true", "yes")
+    
     # Create Bedrock model
-    model = BedrockModel(
-        model_id=final_model_id,
-        region=region,
-        temperature=0.1,
-        max_tokens=4096,
-        streaming=False  # Disable streaming for workshop
-    )
+    with _MODEL_INIT_LOCK:
+        model = BedrockModel(
+            model_id=final_model_id,
+            region=region,
+            temperature=0,
+            max_tokens=4096,
+            streaming=streaming,
+            boto_session=_get_boto_session(region),
+            boto_client_config=_BOTO_CLIENT_CONFIG,
+            **extra_config
+        )
     
     # Add model_id attribute (compatibility)
     if not hasattr(model, 'model_id'):
@@ -6,20 +6,29 @@ FastAPI 서버 - 토지 분석 웹 애플리케이션
 import logging
 import time
 from fastapi import FastAPI, Request, BackgroundTasks, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from pydantic import BaseModel, Field
 import uvicorn
 import asyncio
+import functools
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
 import os
+import sys
 import json
-from weasyprint import HTML
+import multiprocessing
+import orjson
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from main_orchestrator import run_land_analysis_inference, render_html_report
+from main_orchestrator import compile_report_templates, run_land_analysis_inference, render_html_report
+from pdf_renderer import render_pdf
 from logging_config import setup_logging
 
 # --- Logging Setup ---
@@ -58,7 +67,8 @@ class AnalysisResponse(BaseModel):
 app = FastAPI(
     title="토지 분석 AI 서비스 API",
     version="2.0.0",
-    description="MSA 기반 토지 분석 서비스 - JSON API"
+    description="MSA 기반 토지 분석 서비스 - JSON API",
+    default_response_class=ORJSONResponse  # JSON 응답 직렬화에 orjson 사용
 )
 
 # --- Middleware for Logging ---
@@ -67,37 +77,222 @@ async def log_requests(request: Request, call_next):
     """
     Middleware to log incoming requests, their processing time, and status.
     """
-    start_time = time.time()
+    # 헬스 체크(프로브)와 INFO 로그가 꺼진 경우에는 로그용 문자열을 만들지 않음
+    if request.url.path == "/health" or not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+    
+    start_time = time.perf_counter()
+    method = request.method
+    url = str(request.url)
     
     logger.info(
         "Request started",
-        extra={"method": request.method, "url": str(request.url)}
+        extra={"method": method, "url": url}
     )
     
     response = await call_next(request)
     
-    process_time = (time.time() - start_time) * 1000
+    process_time = (time.perf_counter() - start_time) * 1000
     
     logger.info(
         "Request finished",
         extra={
-            "method": request.method,
-            "url": str(request.url),
+            "method": method,
+            "url": url,
             "status_code": response.status_code,
-            "process_time_ms": f"{process_time:.2f}"
+            "process_time_ms": round(process_time, 2)
         }
     )
     return response
 # --------------------------
 
 
+# 정적 파일 Cache-Control (파일명에 해시가 없으므로 immutable 없이 1시간만 캐시)
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+class CachedStaticFiles(StaticFiles):
+    """Cache-Control 헤더를 붙여 주는 StaticFiles"""
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        response.headers.setdefault("Cache-Control", _STATIC_CACHE_CONTROL)
+        return response
+
 # 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+# 로딩 페이지 템플릿은 요청 데이터(task_id 등)를 그대로 출력하므로 보고서용 _JINJA_ENV(autoescape 꺼짐)와 공유하지 않음
+# 컴파일 결과는 바이트코드 캐시(임시 디렉토리)에 저장해 워커/재시작 간에 재사용
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parent / "templates"),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+))
 
 # 분석 작업 상태 저장소 (실제 운영에서는 Redis 등 사용)
 analysis_tasks: Dict[str, Dict[str, Any]] = {}
 
+# WeasyPrint PDF 렌더링용 프로세스 풀 (CPU 작업을 이벤트 루프/GIL 밖에서 실행)
+# spawn 방식이라 워커는 pdf_renderer 만 import 하며, 스레드가 있는 서버 프로세스를 fork 하지 않음
+def _create_pdf_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=int(os.getenv("PDF_WORKERS", "1")),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+_PDF_EXECUTOR = _create_pdf_executor()
+
+async def _render_pdf_in_pool(html_report: str) -> bytes:
+    """
+    프로세스 풀에서 PDF 를 생성합니다.
+    워커가 OOM 등으로 죽으면 풀이 BrokenProcessPool 상태로 남으므로, 새 풀로 교체하고 한 번만 재시도합니다.
+    """
+    global _PDF_EXECUTOR
+    loop = asyncio.get_running_loop()
+    executor = _PDF_EXECUTOR
+    try:
+        return await loop.run_in_executor(executor, render_pdf, html_report)
+    except BrokenProcessPool:
+        logger.warning("PDF worker pool is broken, recreating it")
+        # 동시에 실패한 다른 요청이 이미 교체했다면 그 풀을 그대로 사용
+        if _PDF_EXECUTOR is executor:
+            _PDF_EXECUTOR = _create_pdf_executor()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(_PDF_EXECUTOR, render_pdf, html_report)
+
+@app.on_event("shutdown")
+def _shutdown_pdf_executor():
+    _PDF_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+# 토지 분석 전용 스레드 풀 (기본 executor 를 다른 작업과 공유하지 않고, 동시 분석 수를 제한)
+_ANALYSIS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ANALYSIS_WORKERS", "4")),
+    thread_name_prefix="analysis",
+)
+
+@app.on_event("shutdown")
+def _shutdown_analysis_executor():
+    _ANALYSIS_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+# 완료/오류 작업 보존 기간 및 최대 보관 개수 (진행 중인 작업은 삭제하지 않음)
+_TASK_TTL_SECONDS = int(os.getenv("TASK_TTL_SECONDS", "3600"))
+_MAX_TASKS = int(os.getenv("MAX_TASKS", "1000"))
+_TASK_SWEEP_INTERVAL = 60
+
+# 정상 렌더링된 보고서/PDF 의 Cache-Control (작업 ID 별로 내용이 바뀌지 않음)
+# 작업이 서버에서 삭제되는 시간(TTL) 이상으로는 캐시하지 않으며, 오류 응답에는 붙이지 않음
+_RESULT_CACHE_CONTROL = f"private, max-age={_TASK_TTL_SECONDS}, immutable"
+
+# 렌더링된 보고서 HTML/PDF 캐시: (task_id, template_path 또는 "pdf") → str/bytes
+# 전체 크기(sys.getsizeof 합)가 REPORT_CACHE_MAX_BYTES 를 넘으면 오래 사용하지 않은 항목부터 제거
+# (엔드포인트와 스위퍼 모두 이벤트 루프 스레드에서만 접근하므로 락을 사용하지 않음)
+_REPORT_CACHE_MAX_BYTES = int(os.getenv("REPORT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+_PDF_CACHE_KEY = "pdf"
+_report_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_report_cache_bytes = 0
+
+def _report_cache_get(key: tuple) -> Any:
+    value = _report_cache.get(key)
+    if value is not None:
+        _report_cache.move_to_end(key)
+    return value
+
+def _report_cache_put(key: tuple, value: Any) -> None:
+    global _report_cache_bytes
+    size = sys.getsizeof(value)
+    if size > _REPORT_CACHE_MAX_BYTES:
+        return
+    old = _report_cache.pop(key, None)
+    if old is not None:
+        _report_cache_bytes -= sys.getsizeof(old)
+    _report_cache[key] = value
+    _report_cache_bytes += size
+    while _report_cache_bytes > _REPORT_CACHE_MAX_BYTES:
+        _, evicted = _report_cache.popitem(last=False)
+        _report_cache_bytes -= sys.getsizeof(evicted)
+
+def _report_cache_discard(task_ids: set) -> None:
+    """삭제된 작업의 캐시 항목을 제거"""
+    global _report_cache_bytes
+    for key in [key for key in _report_cache if key[0] in task_ids]:
+        _report_cache_bytes -= sys.getsizeof(_report_cache.pop(key))
+
+def _sweep_tasks() -> int:
+    """만료된 작업을 제거하고, 그래도 최대 개수를 넘으면 오래된 완료 작업부터 제거합니다."""
+    now = datetime.now()
+    finished = [
+        (task_id, task) for task_id, task in tuple(analysis_tasks.items())
+        if task["status"] in ("completed", "error")
+    ]
+    removed = set()
+    for task_id, task in finished:
+        if (now - task["created_at"]).total_seconds() > _TASK_TTL_SECONDS:
+            analysis_tasks.pop(task_id, None)
+            removed.add(task_id)
+    
+    # dict 는 생성 순서를 유지하므로 앞쪽이 가장 오래된 작업
+    excess = len(analysis_tasks) - _MAX_TASKS
+    for task_id, _ in finished:
+        if excess <= 0:
+            break
+        if analysis_tasks.pop(task_id, None) is not None:
+            excess -= 1
+            removed.add(task_id)
+    
+    if removed:
+        _report_cache_discard(removed)
+    return len(removed)
+
+async def _task_sweeper():
+    while True:
+        await asyncio.sleep(_TASK_SWEEP_INTERVAL)
+        try:
+            removed = _sweep_tasks()
+            if removed and logger.isEnabledFor(logging.INFO):
+                logger.info("Expired analysis tasks removed", extra={"removed": removed, "remaining": len(analysis_tasks)})
+        except Exception as e:
+            logger.error("Error sweeping analysis tasks", extra={"error": str(e)})
+
+@app.on_event("startup")
+def _compile_report_templates():
+    # 보고서 템플릿 사전 컴파일 (import 시점이 아닌 서버 시작 시 워커별로 한 번)
+    compile_report_templates()
+
+@app.on_event("startup")
+async def _start_task_sweeper():
+    app.state.task_sweeper = asyncio.create_task(_task_sweeper())
+
+@app.on_event("shutdown")
+async def _stop_task_sweeper():
+    app.state.task_sweeper.cancel()
+
+def _init_task(land_data: Dict[str, Any], analyze_data: Dict[str, Any], message: str) -> Tuple[str, str]:
+    """
+    분석 작업 상태를 등록하고 (task_id, land_data_str) 를 반환합니다.
+    land_data_str 은 orchestrator 가 받는 "'키': '값', ..." 형식 문자열입니다.
+    """
+    task_id = uuid.uuid4().hex
+    # INFO 로그가 꺼져 있으면 extra dict 를 만들지 않음
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Creating new analysis task", extra={"task_id": task_id})
+    
+    land_data_str = ", ".join(f"'{k}': '{v}'" for k, v in land_data.items())
+    
+    # 생성 시각 문자열은 응답마다 변환하지 않도록 미리 계산
+    created_at = datetime.now()
+    analysis_tasks[task_id] = {
+        "status": "processing",
+        "progress": 0,
+        "message": message,
+        "land_data": land_data,
+        "analyze_data": analyze_data,
+        "land_data_str": land_data_str,
+        "created_at": created_at,
+        "created_at_iso": created_at.isoformat(),
+        "result": None,
+        "error": None
+    }
+    return task_id, land_data_str
+
 @app.post("/api/analyze", response_model=AnalysisResponse)
 async def start_analysis(
     request: AnalysisRequest,
@@ -106,27 +301,11 @@ async def start_analysis(
     """토지 분석 시작 - JSON API"""
     
     try:
-        # 고유 작업 ID 생성
-        task_id = str(uuid.uuid4())
-        logger.info("Creating new analysis task", extra={"task_id": task_id})
-        
-        # JSON 데이터를 문자열로 변환 (기존 orchestrator 호환성)
-        land_data_dict = request.land_data.dict()
-        analyze_data_dict = request.analyze_data.dict()
-        land_data_str = ", ".join([f"'{k}': '{v}'" for k, v in land_data_dict.items()])
-        
-        # 작업 상태 초기화
-        analysis_tasks[task_id] = {
-            "status": "processing",
-            "progress": 0,
-            "message": "분석을 시작합니다...",
-            "land_data": land_data_dict,
-            "analyze_data": analyze_data_dict,
-            "land_data_str": land_data_str,
-            "created_at": datetime.now(),
-            "result": None,
-            "error": None
-        }
+        # 작업 상태 초기화 (land_data_str 은 기존 orchestrator 호환용 문자열)
+        analyze_data_dict = request.analyze_data.model_dump()
+        task_id, land_data_str = _init_task(
+            request.land_data.model_dump(), analyze_data_dict, "분석을 시작합니다..."
+        )
         
         # 백그라운드에서 분석 실행
         background_tasks.add_task(run_analysis_task, task_id, land_data_str, analyze_data_dict)
@@ -160,11 +339,14 @@ async def loading_page(request: Request, task_id: str):
     task = analysis_tasks[task_id]
     
     try:
-        return templates.TemplateResponse("loading.html", {
+        response = templates.TemplateResponse("loading.html", {
             "request": request,
             "task_id": task_id,
             "land_data": task["land_data"]
         })
+        # 진행 상태에 따라 내용이 달라지므로 캐시하지 않음
+        response.headers["Cache-Control"] = "no-store"
+        return response
     except Exception as e:
         logger.error("Error rendering loading template", extra={"task_id": task_id, "error": str(e)})
         # Fallback HTML
@@ -177,16 +359,44 @@ async def get_analysis_status(task_id: str):
     if task_id not in analysis_tasks:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
     
-    task = analysis_tasks[task_id]
+    return _task_status(task_id, analysis_tasks[task_id])
+
+def _task_status(task_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    """상태 API / 상태 스트림 공통 응답 본문"""
     return {
         "task_id": task_id,
         "status": task["status"],
         "progress": task["progress"],
         "message": task["message"],
         "error": task.get("error"),
-        "created_at": task["created_at"].isoformat()
+        "created_at": task["created_at_iso"]
     }
 
+# 상태 스트림에서 작업 상태 변화를 확인하는 간격 (서버 내부 dict 조회만 발생)
+_STATUS_STREAM_INTERVAL = 0.5
+
+@app.get("/api/status/{task_id}/stream")
+async def stream_analysis_status(task_id: str):
+    """분석 상태 Server-Sent Events 스트림 - 상태가 바뀔 때만 이벤트 전송, 완료/오류 시 종료"""
+    if task_id not in analysis_tasks:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    async def events():
+        last = None
+        while True:
+            task = analysis_tasks.get(task_id)
+            if task is None:
+                break
+            current = (task["status"], task["progress"], task["message"])
+            if current != last:
+                last = current
+                yield b"data: " + orjson.dumps(_task_status(task_id, task)) + b"\n\n"
+            if task["status"] != "processing":
+                break
+            await asyncio.sleep(_STATUS_STREAM_INTERVAL)
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
 @app.get("/api/result/{task_id}")
 async def get_analysis_result_json(task_id: str):
     """분석 결과 JSON API"""
@@ -207,7 +417,7 @@ async def get_analysis_result_json(task_id: str):
             "status": "completed",
             "land_data": task["land_data"],
             "result": task["result"],
-            "created_at": task["created_at"].isoformat()
+            "created_at": task["created_at_iso"]
         }
     
     raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다.")
@@ -227,12 +437,30 @@ async def get_analysis_result_html(task_id: str):
         return HTMLResponse(f"<h1>분석 중 오류가 발생했습니다.</h1><p>{task['error']}</p>", status_code=500)
     
     if task["status"] == "completed" and task["result"]:
-        # HTML 보고서 렌더링
-        html_report = render_html_report(task["land_data_str"], task["result"], task_id, template_path="web_report_template.html")
-        return HTMLResponse(html_report)
+        # HTML 보고서 렌더링 (완료된 결과는 바뀌지 않으므로 작업별로 한 번만 렌더링)
+        try:
+            html_report = _get_rendered_report(task_id, task, "web_report_template.html")
+        except Exception as e:
+            logger.error("Error rendering HTML report", extra={"task_id": task_id, "error": str(e)})
+            return HTMLResponse(f"<html><body><h1>HTML 보고서 생성 오류</h1><p>{e}</p></body></html>", status_code=500)
+        return HTMLResponse(html_report, headers={"Cache-Control": _RESULT_CACHE_CONTROL})
     
     return HTMLResponse("<h1>결과를 찾을 수 없습니다.</h1>", status_code=404)
 
+def _get_rendered_report(task_id: str, task: Dict[str, Any], template_path: str) -> str:
+    """
+    완료된 작업의 HTML 보고서를 템플릿별로 _report_cache 에 캐시
+    렌더링 오류는 캐시하지 않고 예외로 전달하므로 다음 요청에서 다시 시도합니다.
+    """
+    key = (task_id, template_path)
+    html_report = _report_cache_get(key)
+    if html_report is None:
+        html_report = render_html_report(
+            task["land_data_str"], task["result"], task_id, template_path=template_path, raise_on_error=True
+        )
+        _report_cache_put(key, html_report)
+    return html_report
+
 @app.get("/api/result/{task_id}/pdf")
 async def get_analysis_result_pdf(task_id: str):
     """분석 결과 PDF 다운로드"""
@@ -247,47 +475,52 @@ async def get_analysis_result_pdf(task_id: str):
     if not task["result"]:
         raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다.")
 
-    # HTML 보고서 렌더링
-    html_report = render_html_report(task["land_data_str"], task["result"], task_id, template_path="pdf_template.html")
-    
-    # PDF 생성
-    pdf_bytes = HTML(string=html_report).write_pdf()
+    # PDF 생성 (프로세스 풀에서 실행하여 다른 요청을 막지 않음, 캐시에 남아 있으면 재사용)
+    pdf_key = (task_id, _PDF_CACHE_KEY)
+    pdf_bytes = _report_cache_get(pdf_key)
+    if pdf_bytes is None:
+        try:
+            html_report = _get_rendered_report(task_id, task, "pdf_template.html")
+        except Exception as e:
+            logger.error("Error rendering PDF report HTML", extra={"task_id": task_id, "error": str(e)})
+            raise HTTPException(status_code=500, detail=f"HTML 보고서 생성 오류: {str(e)}")
+        pdf_bytes = await _render_pdf_in_pool(html_report)
+        # 렌더링 중에 작업이 삭제되었다면 캐시하지 않음
+        if task_id in analysis_tasks:
+            _report_cache_put(pdf_key, pdf_bytes)
 
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename=report_{task_id}.pdf"}
+        headers={
+            "Content-Disposition": f"attachment; filename=report_{task_id}.pdf",
+            "Cache-Control": _RESULT_CACHE_CONTROL
+        }
     )
 
 async def run_analysis_task(task_id: str, land_data: str, analyze_data: Dict[str, Any]):
     """백그라운드 분석 작업"""
+    log_info = logger.isEnabledFor(logging.INFO)
     try:
-        logger.info("Starting background analysis task", extra={"task_id": task_id})
-        
-        analysis_tasks[task_id]["progress"] = 10
-        analysis_tasks[task_id]["message"] = "토지 데이터를 파싱하는 중..."
-        await asyncio.sleep(1)
-        
-        analysis_tasks[task_id]["progress"] = 30
-        analysis_tasks[task_id]["message"] = "AI 토지 분석을 수행하는 중..."
-        await asyncio.sleep(2)
+        if log_info:
+            logger.info("Starting background analysis task", extra={"task_id": task_id})
+        task = analysis_tasks[task_id]
         
-        analysis_tasks[task_id]["progress"] = 60
-        analysis_tasks[task_id]["message"] = "관련 정책을 검색하는 중..."
-        await asyncio.sleep(1)
+        def update_progress(progress: int, message: str):
+            # 분석 스레드에서 실제 단계가 끝날 때마다 호출됨
+            task["progress"] = progress
+            task["message"] = message
         
-        analysis_tasks[task_id]["progress"] = 80
-        analysis_tasks[task_id]["message"] = "분석 결과를 정리하는 중..."
-        
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, run_land_analysis_inference, land_data, analyze_data
+        result = await asyncio.get_running_loop().run_in_executor(
+            _ANALYSIS_EXECUTOR, functools.partial(run_land_analysis_inference, land_data, analyze_data, progress_cb=update_progress)
         )
         
         analysis_tasks[task_id]["progress"] = 100
         analysis_tasks[task_id]["message"] = "분석이 완료되었습니다!"
         analysis_tasks[task_id]["status"] = "completed"
         analysis_tasks[task_id]["result"] = result
-        logger.info("Background analysis task completed successfully", extra={"task_id": task_id})
+        if log_info:
+            logger.info("Background analysis task completed successfully", extra={"task_id": task_id})
         
     except Exception as e:
         logger.error("Error in background analysis task", extra={"task_id": task_id, "error": str(e)})
@@ -309,15 +542,18 @@ async def health_check():
 @app.get("/api/tasks")
 async def list_active_tasks():
     """활성 작업 목록 조회"""
-    tasks_summary = []
-    for task_id, task in analysis_tasks.items():
-        tasks_summary.append({
+    # 분석 스레드/스위퍼가 dict 를 변경해도 순회가 깨지지 않도록 스냅샷 사용
+    # (land_data 는 두 작업 생성 경로 모두 dict 로 저장됨)
+    tasks_summary = [
+        {
             "task_id": task_id,
             "status": task["status"],
             "progress": task["progress"],
-            "created_at": task["created_at"].isoformat(),
-            "land_address": task["land_data"].get("주소", "N/A") if isinstance(task["land_data"], dict) else "N/A"
-        })
+            "created_at": task["created_at_iso"],
+            "land_address": task["land_data"].get("주소", "N/A")
+        }
+        for task_id, task in tuple(analysis_tasks.items())
+    ]
     
     return {
         "total_tasks": len(tasks_summary),
@@ -330,14 +566,15 @@ def create_directories():
     os.makedirs("static/js", exist_ok=True)
     os.makedirs("templates", exist_ok=True)
 
+_BROWSER_TEST_PAGE = "browser_test.html"
+
 @app.get("/browser_test.html", response_class=HTMLResponse)
 async def browser_test_page():
     """브라우저 테스트 페이지"""
-    try:
-        with open("browser_test.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(f.read())
-    except FileNotFoundError:
+    # 파일을 읽어 문자열로 디코딩하지 않고 FileResponse 로 그대로 전송
+    if not os.path.isfile(_BROWSER_TEST_PAGE):
         return HTMLResponse("<h1>브라우저 테스트 페이지를 찾을 수 없습니다.</h1>", status_code=404)
+    return FileResponse(_BROWSER_TEST_PAGE, media_type="text/html", headers={"Cache-Control": _STATIC_CACHE_CONTROL})
 
 @app.get("/demo/start")
 async def start_demo_analysis(background_tasks: BackgroundTasks):
@@ -361,24 +598,8 @@ async def start_demo_analysis(background_tasks: BackgroundTasks):
     }
     
     try:
-        # 고유 작업 ID 생성
-        task_id = str(uuid.uuid4())
-        
-        # JSON 데이터를 문자열로 변환
-        land_data_str = ", ".join([f"'{k}': '{v}'" for k, v in demo_land_data.items()])
-        
         # 작업 상태 초기화
-        analysis_tasks[task_id] = {
-            "status": "processing",
-            "progress": 0,
-            "message": "데모 분석을 시작합니다...",
-            "land_data": demo_land_data,
-            "analyze_data": demo_analyze_data,
-            "land_data_str": land_data_str,
-            "created_at": datetime.now(),
-            "result": None,
-            "error": None
-        }
+        task_id, land_data_str = _init_task(demo_land_data, demo_analyze_data, "데모 분석을 시작합니다...")
         
         # 백그라운드에서 분석 실행
         background_tasks.add_task(run_analysis_task, task_id, land_data_str, demo_analyze_data)
@@ -414,6 +635,7 @@ async def api_info():
         "endpoints": {
             "POST /api/analyze": "토지 분석 시작",
             "GET /api/status/{task_id}": "분석 상태 확인",
+            "GET /api/status/{task_id}/stream": "분석 상태 스트림 (SSE)",
             "GET /api/result/{task_id}": "분석 결과 JSON",
             "GET /result/{task_id}": "분석 결과 HTML",
             "GET /loading/{task_id}": "로딩 페이지",
@@ -454,6 +676,7 @@ if __name__ == "__main__":
         "fastapi_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=os.getenv("RELOAD") == "1",
+        workers=int(os.getenv("WORKERS", "1")),
         log_level="info"
     )
\ No newline at end of file
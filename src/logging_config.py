@@ -1,17 +1,73 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
-from pythonjsonlogger import jsonlogger
-
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
-    def add_fields(self, log_record, record, message_dict):
-        super(CustomJsonFormatter, self).add_fields(log_record, record, message_dict)
-        if not log_record.get('timestamp'):
-            # Use a UNIX timestamp
-            log_record['timestamp'] = record.created
-        if log_record.get('level'):
-            log_record['level'] = log_record['level'].upper()
-        else:
-            log_record['level'] = record.levelname
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 모듈 사용
+    orjson = None
+
+# LogRecord 기본 속성 (이 외의 속성은 logger 호출 시 extra 로 전달된 필드)
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+def _dumps(log_record: dict) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_record, default=str).decode()
+        except TypeError:  # 문자열이 아닌 dict 키 등 orjson 이 처리하지 못하는 값
+            pass
+    return json.dumps(log_record, default=str, ensure_ascii=False)
+
+class CustomJsonFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄 JSON 으로 출력합니다.
+    (timestamp, level, name, message 및 extra 필드, 예외 발생 시 exc_info)
+    """
+    def format(self, record):
+        log_record = {
+            'timestamp': record.created,  # UNIX timestamp
+            'level': record.levelname,
+            'name': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                log_record[key] = value
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_record['exc_info'] = record.exc_text
+        if record.stack_info:
+            log_record['stack_info'] = self.formatStack(record.stack_info)
+        return _dumps(log_record)
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지 인자만 병합해서 큐에 넣습니다.
+    (기본 QueueHandler 는 예외 트레이스백을 message 에 합쳐 버리므로 exc_info 를 그대로 넘김)
+    """
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+# stdout 출력은 리스너 스레드에서 수행 (요청 처리 중에는 큐에 넣기만 함)
+_queue_listener = None
+
+def _stop_queue_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()  # 큐에 남은 로그를 모두 출력한 뒤 종료
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
 
 def setup_logging():
     """
@@ -27,14 +83,22 @@ def setup_logging():
     logHandler = logging.StreamHandler(sys.stdout)
     
     # Add our custom formatter
-    formatter = CustomJsonFormatter(
-        '%(timestamp)s %(level)s %(name)s %(message)s'
-    )
+    formatter = CustomJsonFormatter()
     
     logHandler.setFormatter(formatter)
-    logger.addHandler(logHandler)
+
+    # 다시 호출되면 이전 리스너를 정리한 뒤 새로 시작 (리스너 스레드 중복 방지)
+    _stop_queue_listener()
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, logHandler, respect_handler_level=True)
+    _queue_listener.start()
+
+    queueHandler = _QueueHandler(log_queue)
+    logger.addHandler(queueHandler)
 
     # Also configure the uvicorn access logger to use our formatter
     uvicorn_access_logger = logging.getLogger("uvicorn.access")
-    uvicorn_access_logger.addHandler(logHandler)
+    uvicorn_access_logger.handlers.clear()
+    uvicorn_access_logger.addHandler(queueHandler)
     uvicorn_access_logger.propagate = False
@@ -4,13 +4,171 @@ from knowledge_agent_tool import knowledge_agent
 from policy_agent import policy_agent
 from dotenv import load_dotenv
 import json
+import logging
 from datetime import datetime
-from typing import Dict, Any, List
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, Any, List, Callable, Optional
+from jinja2 import Environment, FileSystemLoader, ChoiceLoader, ModuleLoader
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import functools
+import hashlib
+from types import MappingProxyType
+import os
+import threading
+import time
 import re
+import shutil
+import sys
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 모듈만 사용
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# 보고서 템플릿용 Jinja2 환경 (모듈 로드 시 한 번만 생성, 실행 위치와 관계없이 이 모듈 옆의 templates 사용)
+# ai_analysis 는 format_ai_analysis_for_html 에서 이미 HTML로 변환되므로 autoescape 를 사용하지 않는다.
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+_JINJA_OPTIONS = {
+    'autoescape': False,
+    'auto_reload': False,  # 템플릿 파일 변경 여부를 매 렌더링마다 확인하지 않음
+    'cache_size': 400
+}
+_JINJA_ENV = Environment(loader=FileSystemLoader(_TEMPLATE_DIR), **_JINJA_OPTIONS)
+
+def compile_report_templates() -> None:
+    """
+    보고서 템플릿을 Python 모듈로 미리 컴파일(AOT)하고 ModuleLoader 로 로드하도록 전환합니다.
+    서버 시작 시 한 번 호출하며, 프로세스별 임시 디렉토리에 컴파일하므로 여러 워커가 동시에 호출해도
+    서로의 파일을 덮어쓰지 않습니다. 컴파일에 실패하면 원본 템플릿을 그대로 사용합니다.
+    """
+    source_loader = FileSystemLoader(_TEMPLATE_DIR)
+    compiled_dir = tempfile.mkdtemp(prefix='report-templates-')
+    atexit.register(shutil.rmtree, compiled_dir, ignore_errors=True)
+    try:
+        Environment(loader=source_loader, **_JINJA_OPTIONS).compile_templates(compiled_dir, zip=None)
+    except Exception as e:
+        logger.warning("템플릿 사전 컴파일 실패, 원본 템플릿 사용: %s", e)
+        return
+    _JINJA_ENV.loader = ChoiceLoader([ModuleLoader(compiled_dir), source_loader])
+
+# strict=False: LLM 응답의 문자열 값에 포함된 제어 문자(개행 등)를 허용
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+def _loads_json(text: str) -> Any:
+    """
+    orjson 이 있으면 우선 사용하고, 실패하면 표준 json(strict=False)으로 다시 파싱합니다.
+    (orjson 은 문자열 값 안의 제어 문자를 허용하지 않음)
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return _JSON_DECODER.decode(text)
+
+# AI 분석 텍스트 → HTML 변환용 정규식 및 줄 종류
+_NUMBERED_RE = re.compile(r'^(\d+)\.\s*(.+)')
+_BULLET_RE = re.compile(r'^[-*]\s*(.+)')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_LINE_BLANK, _LINE_NUMBERED, _LINE_BULLET, _LINE_TEXT = range(4)
+
+# "'키': '값', ..." 형식의 토지 데이터 문자열 파싱용
+# 따옴표로 감싼 값은 쉼표를 포함할 수 있으므로 통째로 매칭하고, 따옴표 없는 값만 쉼표에서 끊음
+_LAND_FIELD_RE = re.compile(r"'?([^':,]+)'?\s*:\s*(?:'([^']*)'|([^',]*))")
+
+# 토지 데이터 필드명 (파싱된 키를 intern 된 동일 객체로 맞춰 dict 조회 시 동일성 비교로 끝나도록 함)
+_K_ADDR = sys.intern('주소')
+_K_PRICE = sys.intern('공시지가')
+_CANON_LAND_KEYS = {
+    key: key for key in map(sys.intern, (
+        '주소', '지목', '용도지역', '용도지구', '토지이용상황',
+        '지형고저', '형상', '도로접면', '공시지가',
+    ))
+}
+
+# 지식/정책 에이전트 호출용 공용 스레드 풀 (요청마다 스레드를 새로 만들지 않음)
+# 두 분석은 공유 가변 상태 없이 에이전트 호출만 하므로 동시에 실행해도 안전하다.
+# (도구 결과 캐시는 _tool_cache_lock 으로 보호)
+_AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="land-agent")
+
+# 에이전트 도구 호출 결과 캐시 (동일한 토지 데이터에 대한 LLM 재호출 방지)
+_KNOWLEDGE_CACHE_TTL = 7 * 24 * 60 * 60  # 지식 분석: 7일
+_POLICY_CACHE_TTL = 24 * 60 * 60  # 정책 검색: 1일 (신청 기간이 자주 바뀜)
+_TOOL_CACHE_MAXSIZE = 512
+_tool_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_tool_cache_lock = threading.Lock()
+
+def _tool_cache_key(tool_name: str, land_data: str) -> tuple:
+    """
+    land_data 를 "'키': '값'" 단위로 파싱해 정렬한 키/값 쌍으로 캐시 키를 만듭니다.
+    구분자 주변 공백, 값의 따옴표, 필드 순서, 공시지가의 문자열/숫자 표기 차이는 무시하고
+    값 내부의 공백과 대소문자는 그대로 구분합니다. (파싱되지 않는 형식은 앞뒤 공백만 제거한 원문 사용)
+    """
+    fields = _parse_land_data_str(land_data)
+    if fields:
+        canonical = json.dumps(sorted(fields.items()), ensure_ascii=False)
+    else:
+        canonical = land_data.strip()
+    return (tool_name, hashlib.sha1(canonical.encode('utf-8')).hexdigest())
+
+def _cached_tool_call(tool_name: str, land_data: str, ttl: float, call: Callable[[], str], error_prefix: str,
+                      cacheable: Optional[Callable[[str], bool]] = None) -> str:
+    """
+    tool_name 과 정규화된 land_data 해시(_tool_cache_key)를 키로 도구 호출 결과를 캐시합니다.
+    "'공시지가': 3735000" 과 "'공시지가': '3735000'" 처럼 표기만 다른 동일 토지 데이터는
+    같은 캐시 항목을 사용합니다.
+    오류 응답(error_prefix 로 시작)과 cacheable 이 False 를 반환하는 응답은 캐시하지 않습니다.
+    """
+    key = _tool_cache_key(tool_name, land_data)
+    now = time.monotonic()
+    
+    with _tool_cache_lock:
+        entry = _tool_cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > now:
+                _tool_cache.move_to_end(key)
+                return result
+            del _tool_cache[key]
+    
+    result = call()
+    
+    if not result.startswith(error_prefix) and (cacheable is None or cacheable(result)):
+        with _tool_cache_lock:
+            _tool_cache[key] = (now + ttl, result)
+            _tool_cache.move_to_end(key)
+            while len(_tool_cache) > _TOOL_CACHE_MAXSIZE:
+                _tool_cache.popitem(last=False)
+    
+    return result
+
+# 주소에 포함된 시/도 명칭 → 정책 검색용 지역 태그
+_REGION_ALIASES = {
+    '서울': '서울', '부산': '부산', '대구': '대구', '인천': '인천', '광주': '광주',
+    '대전': '대전', '울산': '울산', '세종': '세종', '경기': '경기', '강원': '강원',
+    '충북': '충북', '충청북도': '충북', '충남': '충남', '충청남도': '충남',
+    '전북': '전북', '전라북도': '전북', '전남': '전남', '전라남도': '전남',
+    '경북': '경북', '경상북도': '경북', '경남': '경남', '경상남도': '경남',
+    '제주': '제주',
+}
+# 긴 별칭을 먼저 시도하도록 길이 역순으로 정렬
+_REGION_RE = re.compile('|'.join(map(re.escape, sorted(_REGION_ALIASES, key=len, reverse=True))))
+
+# 토지 데이터 문자열의 "주소: ..." 값 (따옴표 제외)
+_ADDRESS_RE = re.compile(r"주소['\"]?\s*:\s*['\"]?([^,'\"\n]+)")
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_region(address: str) -> str:
+    """주소에서 시/도 지역 태그를 찾습니다. 없으면 빈 문자열"""
+    match = _REGION_RE.search(address)
+    return _REGION_ALIASES[match.group(0)] if match else ""
+
 @tool
 def land_knowledge_analysis(land_data: str) -> str:
     """
@@ -36,7 +194,10 @@ def land_knowledge_analysis(land_data: str) -> str:
     7. 투자 가치 평가
     """
     
-    return knowledge_agent(query)
+    return _cached_tool_call(
+        'land_knowledge_analysis', land_data, _KNOWLEDGE_CACHE_TTL,
+        lambda: knowledge_agent(query), "지식 검색 에이전트 오류"
+    )
 
 @tool
 def policy_search_analysis(land_data: str) -> str:
@@ -49,49 +210,18 @@ def policy_search_analysis(land_data: str) -> str:
     Returns:
         관련 정부 지원 정책 정보
     """
-    # 주소에서 지역 정보 추출
-    address = ""
-    for line in land_data.split('\n'):
-        if '주소' in line:
-            address = line.split(':')[1].strip().replace("'", "")
-            break
+    # 주소에서 지역 정보 추출 (줄 단위 split 없이 한 번의 검색)
+    match = _ADDRESS_RE.search(land_data)
+    address = match.group(1).strip() if match else ""
     
+    return _search_policies(land_data, address)
+
+def _search_policies(land_data: str, address: str) -> str:
+    """
+    policy_search_analysis 의 본체. 이미 파싱된 주소를 받아 주소 재추출을 생략합니다.
+    """
     # 지역명 추출 (시/도 단위)
-    region = ""
-    if "서울" in address:
-        region = "서울"
-    elif "부산" in address:
-        region = "부산"
-    elif "대구" in address:
-        region = "대구"
-    elif "인천" in address:
-        region = "인천"
-    elif "광주" in address:
-        region = "광주"
-    elif "대전" in address:
-        region = "대전"
-    elif "울산" in address:
-        region = "울산"
-    elif "세종" in address:
-        region = "세종"
-    elif "경기" in address:
-        region = "경기"
-    elif "강원" in address:
-        region = "강원"
-    elif "충북" in address or "충청북도" in address:
-        region = "충북"
-    elif "충남" in address or "충청남도" in address:
-        region = "충남"
-    elif "전북" in address or "전라북도" in address:
-        region = "전북"
-    elif "전남" in address or "전라남도" in address:
-        region = "전남"
-    elif "경북" in address or "경상북도" in address:
-        region = "경북"
-    elif "경남" in address or "경상남도" in address:
-        region = "경남"
-    elif "제주" in address:
-        region = "제주"
+    region = _resolve_region(address)
     
     query = f"""
     다음 토지 정보와 관련된 정부 지원 정책을 찾아주세요:
@@ -105,136 +235,139 @@ def policy_search_analysis(land_data: str) -> str:
     - 지역 개발 관련 기술 지원 정책
     """
     
-    return policy_agent(query)
+    # Bizinfo 장애/API 키 누락 시 search_bizinfo_projects 가 "[]" 를 반환하므로
+    # 정책이 하나도 없는 응답(또는 JSON 이 없는 응답)은 캐시하지 않고 다음 호출에서 다시 검색
+    return _cached_tool_call(
+        'policy_search_analysis', land_data, _POLICY_CACHE_TTL,
+        lambda: policy_agent(query), "정책 에이전트 오류",
+        cacheable=lambda result: bool(_parse_policy_projects(result))
+    )
+
+# 월 → 분기 (인덱스 0 은 사용하지 않음)
+_MONTH_TO_QUARTER = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+# 정책 응답을 아직 파싱하지 않았음을 나타내는 기본값 (None 은 "JSON 없음")
+_UNPARSED: Any = object()
+
+_NO_POLICY_MARKDOWN = "### 관련 정부 지원 정책\n\n해당 지역과 관련된 정부 지원 정책 정보를 찾지 못했습니다."
+
+# 정책 응답 텍스트 fallback 에서 제외할 줄 (도구 로그, 태그, JSON 괄호 등)
+_SKIP_LINE_RE = re.compile(r'^(?:Tool #|---|</?search_quality_|</?result>|[{}])|Response \[200\]')
 
+# 마크다운 보고서의 정책 항목 형식
+_POLICY_MARKDOWN_TMPL = (
+    "#### {i}. 지원정책\n\n"
+    "- **지원정책 이름**: {name}\n"
+    "- **주관**: {organization}\n"
+    "- **기간**: {period}\n"
+    "- **요약**: {summary}\n"
+    "- **링크**: {url}\n\n"
+)
+
+def _extract_first_json(text: str, key: Optional[str] = None) -> Optional[Dict]:
+    """
+    문자열에서 처음으로 디코딩되는 JSON 객체를 찾습니다. (key 가 주어지면 해당 키를 가진 객체)
+    각 '{' 위치에서 raw_decode 를 시도하므로 괄호 짝 맞추기는 C 스캐너가 처리하고,
+    문자열 값 안의 '}' 나 뒤따르는 텍스트도 문제가 되지 않습니다.
+    """
+    i = text.find('{')
+    while i != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, i)
+            if isinstance(obj, dict) and (key is None or key in obj):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        i = text.find('{', i + 1)
+    return None
+
+def _parse_policy_projects(policy_response: str) -> Optional[List[Dict]]:
+    """
+    정책 에이전트 응답에서 projects 배열을 한 번만 추출합니다.
+    <result> 태그 → 응답 중 "projects" 키를 가진 첫 번째 JSON 객체 순서로 시도하며,
+    JSON 을 찾지 못하면 None 을 반환합니다. (유효한 JSON 에 정책이 없으면 빈 리스트)
+    """
+    response_str = str(policy_response).strip()
+    
+    # 방법 1: <result> 태그 내부의 JSON
+    result_start = response_str.find('<result>')
+    result_end = response_str.find('</result>')
+    if result_start != -1 and result_end != -1:
+        result_content = response_str[result_start + 8:result_end].strip()
+        try:
+            policy_data = _loads_json(result_content)
+            if isinstance(policy_data, dict):
+                return policy_data.get("projects", [])
+        except json.JSONDecodeError as e:
+            logger.debug("<result> 태그 내 JSON 파싱 실패: %s", e)
+    
+    # 이중 중괄호 처리 (정상 JSON 에는 '{{' 가 나타나지 않음)
+    # 프롬프트는 단일 중괄호로 수정했지만, 캐시되어 있거나 모델이 그대로 흉내 낸 응답을 위해 유지
+    if '{{' in response_str:
+        response_str = response_str.replace('{{', '{').replace('}}', '}')
+    
+    # 방법 2: "projects" 키를 가진 첫 번째 JSON 객체 (앞뒤 텍스트는 무시)
+    policy_data = _extract_first_json(response_str, "projects")
+    if policy_data is not None:
+        return policy_data["projects"]
+    
+    logger.debug("정책 응답에서 JSON 을 찾지 못함")
+    return None
 
-def parse_policy_response_for_template(policy_response: str) -> List[Dict[str, str]]:
+def parse_policy_response_for_template(policy_response: str, projects: Optional[List[Dict]] = _UNPARSED) -> List[Dict[str, str]]:
     """
     정책 에이전트 응답을 파싱하여 템플릿용 구조화된 데이터로 변환합니다.
-    매우 강화된 파싱 로직으로 다양한 응답 형식을 처리합니다.
+    이미 추출한 projects 가 주어지면 JSON 을 다시 파싱하지 않습니다.
     """
     policies = []
     
     try:
-        print(f"🔍 정책 응답 분석:")
-        print(f"   타입: {type(policy_response)}")
-        print(f"   길이: {len(str(policy_response))}")
+        logger.debug("정책 응답 분석 - 타입: %s, 길이: %d", type(policy_response), len(str(policy_response)))
         
         # 문자열로 변환 및 정리
         response_str = str(policy_response).strip()
         
         # 숨겨진 문자 제거
-        import re
         response_str = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', response_str)
         
-        print(f"   정리 후 길이: {len(response_str)}")
-        print(f"   미리보기: {response_str[:200]}...")
+        logger.debug("정리 후 길이: %d, 미리보기: %.200s...", len(response_str), response_str)
         
-        # 디버그 파일 저장 (항상 저장하여 패턴 분석)
-        debug_filename = f"policy_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        try:
-            with open(debug_filename, 'w', encoding='utf-8') as f:
-                f.write("=== POLICY AGENT RESPONSE DEBUG ===\n")
-                f.write(f"Timestamp: {datetime.now()}\n\n")
-                f.write("---" + "ORIGINAL RESPONSE" + "---" + "\n")
-                f.write(str(policy_response))
-                f.write("\n\n---" + "CLEANED RESPONSE" + "---" + "\n")
-                f.write(response_str)
-            print(f"📁 디버그 파일 저장: {debug_filename}")
-        except Exception as e:
-            print(f"❌ 디버그 파일 저장 실패: {str(e)}")
-        
-        # 방법 1: 이중 중괄호 처리 (가장 일반적인 문제)
-        print("🔍 이중 중괄호 처리...")
-        if '{{' in response_str and '}}' in response_str:
-            print("✅ 이중 중괄호 발견 - 단일 중괄호로 변환")
-            # 이중 중괄호를 단일 중괄호로 변환
-            cleaned_response = response_str.replace('{{', '{').replace('}}', '}')
-            
-            # JSON 패턴 찾기
-            json_match = re.search(r'{{s*"projects"s*:s*[[^]]*?]]s*}s*}', cleaned_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                try:
-                    policy_data = json.loads(json_str)
-                    projects = policy_data.get("projects", [])
-                    print(f"✅ 이중 중괄호 처리로 {len(projects)}개 프로젝트 파싱")
-                    policies.extend(extract_policies_from_projects(projects))
-                except json.JSONDecodeError as e:
-                    print(f"❌ 이중 중괄호 처리 후 JSON 파싱 실패: {e}")
-        
-        # 방법 2: <result> 태그 파싱
-        if not policies:
-            print("🔍 <result> 태그 검색...")
-            result_match = re.search(r'<result>(.*?)</result>', response_str, re.DOTALL)
-            if result_match:
-                print("✅ <result> 태그 발견")
-                result_content = result_match.group(1).strip()
-                try:
-                    policy_data = json.loads(result_content)
-                    projects = policy_data.get("projects", [])
-                    print(f"✅ <result>에서 {len(projects)}개 프로젝트 파싱")
-                    policies.extend(extract_policies_from_projects(projects))
-                except json.JSONDecodeError as e:
-                    print(f"❌ <result> JSON 파싱 실패: {e}")
-        
-        # 방법 3: 직접 JSON 패턴 찾기 (다양한 패턴)
-        if not policies:
-            print("🔍 직접 JSON 패턴 검색...")
-            
-            # 더 많은 패턴들
-            patterns = [
-                r'{{s*"projects"s*:s*[[^]]*?]]s*}s*}',  # 표준 패턴
-                r'"projects"s*:s*[[^]]*?]]',  # projects 배열만
-                r'{{s*"projects"s*:s*[[^}]*]]s*}s*}',  # 중첩 방지
-            ]
-            
-            for i, pattern in enumerate(patterns, 1):
-                print(f"   패턴 {i} 시도: {pattern[:30]}...")
-                matches = re.findall(pattern, response_str, re.DOTALL)
-                
-                if matches:
-                    print(f"   ✅ {len(matches)}개 매치 발견")
-                    for match in matches:
-                        try:
-                            # projects 배열만 매치된 경우 JSON 객체로 감싸기
-                            if not match.strip().startswith('{'):
-                                match = '{"' + match + '}'
-                            
-                            policy_data = json.loads(match)
-                            projects = policy_data.get("projects", [])
-                            print(f"   ✅ {len(projects)}개 프로젝트 파싱")
-                            policies.extend(extract_policies_from_projects(projects))
-                            break
-                        except json.JSONDecodeError as e:
-                            print(f"   ❌ JSON 파싱 실패: {e}")
-                            continue
-                
-                if policies:
-                    break
-        
-        # 방법 4: 전체 응답을 JSON으로 파싱 시도
-        if not policies:
-            print("🔍 전체 응답 JSON 파싱 시도...")
+        # 디버그 파일 저장 (DEBUG 로그 레벨에서만, 응답 패턴 분석용)
+        debug_filename = None
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_time = datetime.now()
+            debug_filename = f"policy_debug_{debug_time.strftime('%Y%m%d_%H%M%S')}.txt"
             try:
-                policy_data = json.loads(response_str)
-                if isinstance(policy_data, dict) and "projects" in policy_data:
-                    projects = policy_data["projects"]
-                    print(f"   ✅ 전체 JSON에서 {len(projects)}개 프로젝트 파싱")
-                    policies.extend(extract_policies_from_projects(projects))
-            except json.JSONDecodeError:
-                print("   ❌ 전체 JSON 파싱 실패")
-        
-        # 방법 5: 정규식으로 개별 프로젝트 추출 (최후의 수단)
+                with open(debug_filename, 'w', encoding='utf-8') as f:
+                    f.write("=== POLICY AGENT RESPONSE DEBUG ===\n")
+                    f.write(f"Timestamp: {debug_time}\n\n")
+                    f.write("---" + "ORIGINAL RESPONSE" + "---" + "\n")
+                    f.write(str(policy_response))
+                    f.write("\n\n---" + "CLEANED RESPONSE" + "---" + "\n")
+                    f.write(response_str)
+                logger.debug("디버그 파일 저장: %s", debug_filename)
+            except Exception as e:
+                logger.warning("디버그 파일 저장 실패: %s", e)
+                debug_filename = None
+        
+        # 방법 1: 공통 JSON 추출 결과 사용
+        if projects is _UNPARSED:
+            projects = _parse_policy_projects(response_str)
+        if projects is not None:
+            # 유효한 JSON 이면 정책이 없더라도 정규식/키워드 기반 추출을 건너뜀
+            logger.debug("JSON 에서 %d개 프로젝트 파싱", len(projects))
+            return extract_policies_from_projects(projects)
+        
+        # 방법 2: 정규식으로 개별 프로젝트 추출 (최후의 수단)
         if not policies:
-            print("🔍 개별 프로젝트 정규식 추출...")
+            logger.debug("개별 프로젝트 정규식 추출...")
             
             # projectName 패턴으로 개별 프로젝트 찾기
-            project_pattern = r'"projectName"s*:s*"([^"]*)".*?"organization"s*:s*"([^"]*)".*?"applicationPeriod"s*:s*"([^"]*)".*?"summary"s*:s*"([^"]*)".*?"detailsUrl"s*:s*"([^"]*)"'
+            project_pattern = r'"projectName"\s*:\s*"([^"]*)".*?"organization"\s*:\s*"([^"]*)".*?"applicationPeriod"\s*:\s*"([^"]*)".*?"summary"\s*:\s*"([^"]*)".*?"detailsUrl"\s*:\s*"([^"]*)"'
             
             matches = re.findall(project_pattern, response_str, re.DOTALL)
             if matches:
-                print(f"   ✅ 정규식으로 {len(matches)}개 프로젝트 추출")
+                logger.debug("정규식으로 %d개 프로젝트 추출", len(matches))
                 for match in matches:
                     policy = {
                         'name': match[0].strip(),
@@ -245,25 +378,26 @@ def parse_policy_response_for_template(policy_response: str) -> List[Dict[str, s
                     }
                     policies.append(policy)
         
-        # 방법 6: 키워드 기반 더미 정책 생성 (최후의 최후)
+        # 방법 3: 키워드 기반 더미 정책 생성 (최후의 최후)
         if not policies:
-            print("🔍 키워드 기반 정책 감지...")
+            logger.debug("키워드 기반 정책 감지...")
             if 'projectName' in response_str or '정책' in response_str or '지원' in response_str:
-                print("✅ 정책 관련 키워드 발견 - 더미 정책 생성")
+                logger.warning("정책 관련 키워드 발견 - 더미 정책 생성")
+                summary = '정책 데이터가 감지되었으나 파싱에 실패했습니다.'
+                if debug_filename:
+                    summary += f' 디버그 파일을 확인하세요: {debug_filename}'
                 policies.append({
                     'name': '정책 파싱 오류 - 원본 데이터 확인 필요',
                     'organization': '시스템',
                     'period': '확인 필요',
-                    'summary': f'정책 데이터가 감지되었으나 파싱에 실패했습니다. 디버그 파일을 확인하세요: {debug_filename}',
+                    'summary': summary,
                     'url': ''
                 })
             else:
-                print("❌ 정책 관련 키워드를 찾을 수 없음")
+                logger.debug("정책 관련 키워드를 찾을 수 없음")
     
     except Exception as e:
-        print(f"❌ 정책 파싱 전체 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("정책 파싱 전체 오류: %s", e)
         
         # 오류 발생 시에도 더미 정책 생성
         policies.append({
@@ -274,9 +408,9 @@ def parse_policy_response_for_template(policy_response: str) -> List[Dict[str, s
             'url': ''
         })
     
-    print(f"📊 최종 파싱된 정책 개수: {len(policies)}")
+    logger.info("최종 파싱된 정책 개수: %d", len(policies))
     if policies:
-        print(f"📋 첫 번째 정책: {policies[0]['name'][:50]}...")
+        logger.debug("첫 번째 정책: %.50s...", policies[0]['name'])
     
     return policies
 
@@ -296,141 +430,100 @@ def extract_policies_from_projects(projects: List[Dict]) -> List[Dict[str, str]]
     
     return policies
 
-def parse_policy_response(policy_response: str) -> str:
+def _format_policies_markdown(projects: List[Dict]) -> str:
+    """프로젝트 리스트를 마크다운 정책 목록으로 변환"""
+    parts = ["### 관련 정부 지원 정책\n\n"]
+    parts.extend(
+        _POLICY_MARKDOWN_TMPL.format(
+            i=i,
+            name=project.get('projectName', 'N/A'),
+            organization=project.get('organization', 'N/A'),
+            period=project.get('applicationPeriod', 'N/A'),
+            summary=project.get('summary', 'N/A'),
+            url=project.get('detailsUrl', 'N/A')
+        )
+        for i, project in enumerate(projects, 1)
+    )
+    return "".join(parts)
+
+def parse_policy_response(policy_response: str, projects: Optional[List[Dict]] = _UNPARSED) -> str:
     """
     정책 에이전트 응답을 파싱하여 구조화된 형식으로 변환합니다.
+    이미 추출한 projects 가 주어지면 JSON 을 다시 파싱하지 않습니다.
     """
     try:
-        # <result> 태그 내부의 JSON 찾기
-        result_start = policy_response.find('<result>')
-        result_end = policy_response.find('</result>')
+        if projects is _UNPARSED:
+            projects = _parse_policy_projects(policy_response)
+        if projects is not None:
+            # 유효한 JSON 이면 정책이 없더라도 텍스트 기반 추출을 건너뜀
+            return _format_policies_markdown(projects) if projects else _NO_POLICY_MARKDOWN
         
-        if result_start != -1 and result_end != -1:
-            # <result> 태그 내부 추출
-            result_content = policy_response[result_start + 8:result_end].strip()
-            
-            try:
-                policy_data = json.loads(result_content)
-                projects = policy_data.get("projects", [])
-                
-                if projects:
-                    formatted_content = "### 관련 정부 지원 정책\n\n"
-                    
-                    for i, project in enumerate(projects, 1):
-                        formatted_content += f"#### {i}. 지원정책\n\n"
-                        formatted_content += f"- **지원정책 이름**: {project.get('projectName', 'N/A')}\n"
-                        formatted_content += f"- **주관**: {project.get('organization', 'N/A')}\n"
-                        formatted_content += f"- **기간**: {project.get('applicationPeriod', 'N/A')}\n"
-                        formatted_content += f"- **요약**: {project.get('summary', 'N/A')}\n"
-                        formatted_content += f"- **링크**: {project.get('detailsUrl', 'N/A')}\n\n"
-                    
-                    return formatted_content
-                    
-            except json.JSONDecodeError as e:
-                print(f"<result> 태그 내 JSON 파싱 실패: {str(e)}")
-        
-        # <result> 태그가 없는 경우 기존 방식으로 JSON 찾기
-        json_start = policy_response.find('{"projects":')
-        if json_start == -1:
-            json_start = policy_response.find('{{')
-        
-        if json_start != -1:
-            # JSON 끝 찾기
-            brace_count = 0
-            json_end = json_start
-            for i, char in enumerate(policy_response[json_start:], json_start):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
-            
-            if json_end > json_start:
-                json_str = policy_response[json_start:json_end]
-                # 이중 중괄호 처리
-                json_str = json_str.replace('{{', '{').replace('}}', '}')
-                
-                try:
-                    policy_data = json.loads(json_str)
-                    projects = policy_data.get("projects", [])
-                    
-                    if projects:
-                        formatted_content = "### 관련 정부 지원 정책\n\n"
-                        
-                        for i, project in enumerate(projects, 1):
-                            formatted_content += f"#### {i}. 지원정책\n\n"
-                            formatted_content += f"- **지원정책 이름**: {project.get('projectName', 'N/A')}\n"
-                            formatted_content += f"- **주관**: {project.get('organization', 'N/A')}\n"
-                            formatted_content += f"- **기간**: {project.get('applicationPeriod', 'N/A')}\n"
-                            formatted_content += f"- **요약**: {project.get('summary', 'N/A')}\n"
-                            formatted_content += f"- **링크**: {project.get('detailsUrl', 'N/A')}\n\n"
-                        
-                        return formatted_content
-                    
-                except json.JSONDecodeError as e:
-                    print(f"기존 방식 JSON 파싱 실패: {str(e)}")
-        
-        # JSON 파싱 실패 시 텍스트에서 유용한 정보 추출
-        lines = policy_response.split('\n')
-        clean_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # 불필요한 라인 제거 (더 많은 패턴 추가)
-            if (line and 
-                not line.startswith('Tool #') and 
-                not line.startswith('---') and 
-                'Response [200]' not in line and 
-                not line.startswith('<search_quality_') and
-                not line.startswith('</search_quality_') and
-                not line.startswith('<result>') and
-                not line.startswith('</result>') and
-                not line.startswith('{') and 
-                not line.startswith('}')):
-                clean_lines.append(line)
+        # JSON 파싱 실패 시 텍스트에서 유용한 정보 추출 (빈 줄과 불필요한 라인 제거)
+        skip = _SKIP_LINE_RE.search
+        clean_lines = [line for line in map(str.strip, policy_response.split('\n')) if line and not skip(line)]
         
         if clean_lines:
             return "### 관련 정부 지원 정책\n\n" + '\n'.join(clean_lines)
         else:
-            return "### 관련 정부 지원 정책\n\n해당 지역과 관련된 정부 지원 정책 정보를 찾지 못했습니다."
+            return _NO_POLICY_MARKDOWN
             
     except Exception as e:
         return f"### 관련 정부 지원 정책\n\n정책 정보 처리 중 오류가 발생했습니다: {str(e)}"
 
-def create_korean_land_report(land_data: Dict[str, Any], knowledge_analysis: str, policy_analysis: str) -> str:
+# 마크다운 보고서 "토지 기본 정보" 표의 항목 순서 (공시지가는 별도 포맷)
+_REPORT_INFO_FIELDS = ('주소', '지목', '용도지역', '용도지구', '토지이용상황', '지형고저', '형상', '도로접면')
+
+# 마크다운 보고서 마지막의 고정 문구
+_REPORT_RECOMMENDATIONS = """### 권고사항
+1. 관련 정부 지원 정책 적극 활용 검토
+2. 용도지역 특성에 맞는 개발 계획 수립
+3. 지역 개발 동향 지속적 모니터링
+4. 전문가 자문을 통한 세부 투자 계획 수립
+
+---
+*본 보고서는 AI 기반 분석 결과이며, 실제 투자 결정 시에는 전문가의 추가 검토가 필요합니다.*
+"""
+
+def _format_gongsi_price(gongsi_price: Any) -> str:
+    """공시지가를 표시용 문자열로 변환 (숫자면 천 단위 구분 + '원')"""
+    if isinstance(gongsi_price, (int, float)):
+        return f"{gongsi_price:,}원"
+    return str(gongsi_price)
+
+def create_korean_land_report(land_data: Dict[str, Any], knowledge_analysis: str, policy_analysis: str, policy_projects: Optional[List[Dict]] = _UNPARSED, current_date: datetime = None) -> str:
     """
     토지 분석 결과를 종합하여 한국어 보고서를 생성합니다.
+    policy_projects 가 주어지면 정책 응답을 다시 파싱하지 않습니다.
     """
-    current_date = datetime.now().strftime("%Y년 %m월 %d일")
+    if current_date is None:
+        current_date = datetime.now()
+    report_date = current_date.strftime("%Y년 %m월 %d일")
     
     # 공시지가 포맷팅 처리
-    gongsi_price = land_data.get('공시지가', 0)
-    if isinstance(gongsi_price, (int, float)):
-        gongsi_display = f"{gongsi_price:,}원"
-    else:
-        gongsi_display = str(gongsi_price)
+    gongsi_display = _format_gongsi_price(land_data.get(_K_PRICE, 0))
     
     # 정책 분석 결과를 구조화된 형식으로 파싱
-    policy_content = parse_policy_response(policy_analysis)
+    policy_content = parse_policy_response(policy_analysis, policy_projects)
+    
+    # 표와 종합 의견에서 같은 필드를 다시 조회하지 않도록 한 번만 꺼내 둠 (없는 필드는 None)
+    values = {field: land_data.get(field) for field in _REPORT_INFO_FIELDS}
+    address, zone, usage = (
+        '' if values[field] is None else values[field] for field in ('주소', '용도지역', '토지이용상황')
+    )
+    
+    # 토지 기본 정보 표 (공시지가 제외)
+    info_rows = "\n".join([f"| {field} | {'N/A' if value is None else value} |" for field, value in values.items()])
     
+    # 모든 값을 미리 계산한 뒤 보고서 본문은 한 번만 포맷
     report = f"""# 토지 분석 보고서
 
-**작성일**: {current_date}
+**작성일**: {report_date}
 
 ## 1. 토지 기본 정보
 
 | 항목 | 내용 |
 |------|------|
-| 주소 | {land_data.get('주소', 'N/A')} |
-| 지목 | {land_data.get('지목', 'N/A')} |
-| 용도지역 | {land_data.get('용도지역', 'N/A')} |
-| 용도지구 | {land_data.get('용도지구', 'N/A')} |
-| 토지이용상황 | {land_data.get('토지이용상황', 'N/A')} |
-| 지형고저 | {land_data.get('지형고저', 'N/A')} |
-| 형상 | {land_data.get('형상', 'N/A')} |
-| 도로접면 | {land_data.get('도로접면', 'N/A')} |
+{info_rows}
 | 공시지가 | {gongsi_display} |
 
 ## 2. 전문가 토지 분석
@@ -445,51 +538,70 @@ def create_korean_land_report(land_data: Dict[str, Any], knowledge_analysis: str
 
 위의 분석 결과를 종합하면, 해당 토지는 다음과 같은 특성을 가지고 있습니다:
 
-- **위치적 장점**: {land_data.get('주소', '')}에 위치하여 접근성이 우수
-- **용도지역 특성**: {land_data.get('용도지역', '')}으로 분류되어 상업적 활용 가능
-- **현재 이용상황**: {land_data.get('토지이용상황', '')}으로 활용 중
+- **위치적 장점**: {address}에 위치하여 접근성이 우수
+- **용도지역 특성**: {zone}으로 분류되어 상업적 활용 가능
+- **현재 이용상황**: {usage}으로 활용 중
 - **투자 가치**: 공시지가 {gongsi_display} 기준 평가
 
-### 권고사항
-1. 관련 정부 지원 정책 적극 활용 검토
-2. 용도지역 특성에 맞는 개발 계획 수립
-3. 지역 개발 동향 지속적 모니터링
-4. 전문가 자문을 통한 세부 투자 계획 수립
-
----
-*본 보고서는 AI 기반 분석 결과이며, 실제 투자 결정 시에는 전문가의 추가 검토가 필요합니다.*
-"""
+{_REPORT_RECOMMENDATIONS}"""
     
     return report
 
+@functools.lru_cache(maxsize=256)
 def format_ai_analysis_for_html(analysis_text: str) -> str:
     """
     AI 분석 텍스트를 HTML 형식으로 변환합니다.
     번호 목록과 불릿 목록을 적절한 HTML 태그로 변환합니다.
+    입력에만 의존하는 순수 함수이므로 결과를 캐시합니다. (캐시된 지식 분석 재사용 시 재변환 방지)
     """
-    lines = analysis_text.split('\n')
+    # 굵은 글씨 처리는 줄 단위가 아닌 전체 텍스트에 한 번만 적용 (** 는 줄을 넘지 않음)
+    analysis_text = _BOLD_RE.sub(r'<strong>\1</strong>', analysis_text)
+    lines = [line.strip() for line in analysis_text.split('\n')]
+    line_count = len(lines)
+    
+    # 각 줄의 종류를 한 번만 판별 (빈 줄 / 번호 / 불릿 / 일반 텍스트)
+    kinds = []
+    matches = []
+    for line in lines:
+        if not line:
+            kinds.append(_LINE_BLANK)
+            matches.append(None)
+            continue
+        match = _NUMBERED_RE.match(line)
+        if match:
+            kinds.append(_LINE_NUMBERED)
+        else:
+            match = _BULLET_RE.match(line)
+            kinds.append(_LINE_BULLET if match else _LINE_TEXT)
+        matches.append(match)
+    
+    # next_marker[i]: i번째 줄부터 빈 줄 전까지 처음 나타나는 번호/불릿 줄의 종류
+    next_marker = [_LINE_BLANK] * (line_count + 1)
+    for i in range(line_count - 1, -1, -1):
+        kind = kinds[i]
+        if kind == _LINE_TEXT:
+            next_marker[i] = next_marker[i + 1]
+        elif kind != _LINE_BLANK:
+            next_marker[i] = kind
+    
     formatted_lines = []
     in_numbered_list = False
     in_bullet_list = False
-    current_numbered_item = None
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for i, line in enumerate(lines):
+        kind = kinds[i]
         
         # 빈 줄 처리
-        if not line:
+        if kind == _LINE_BLANK:
             # 불릿 리스트만 종료 (번호 리스트는 유지)
             if in_bullet_list:
                 formatted_lines.append('</ul>')
                 in_bullet_list = False
             formatted_lines.append('')
-            i += 1
             continue
         
         # 번호 목록 처리 (1., 2., 3. 등)
-        numbered_match = re.match(r'^(\d+)\.\s*(.+)', line)
-        if numbered_match:
+        if kind == _LINE_NUMBERED:
             # 이전 불릿 리스트 종료
             if in_bullet_list:
                 formatted_lines.append('</ul>')
@@ -500,42 +612,22 @@ def format_ai_analysis_for_html(analysis_text: str) -> str:
                 formatted_lines.append('<ol>')
                 in_numbered_list = True
             
-            number = numbered_match.group(1)
-            content = numbered_match.group(2)
-            current_numbered_item = number
-            
-            # 굵은 글씨 처리
-            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+            content = matches[i].group(2)
             
             # 번호 항목 시작 (닫지 않음 - 하위 불릿이 있을 수 있음)
             formatted_lines.append(f'<li><strong>{content}</strong>')
             
-            # 다음 줄들을 확인하여 불릿 항목이 있는지 체크
-            j = i + 1
-            has_bullets = False
-            while j < len(lines) and lines[j].strip():
-                if re.match(r'^[-*]\s*(.+)', lines[j].strip()):
-                    has_bullets = True
-                    break
-                elif re.match(r'^(\d+)\.\s*(.+)', lines[j].strip()):
-                    break
-                j += 1
-            
-            if has_bullets:
+            # 다음 줄들에 불릿 항목이 있는지 체크
+            if next_marker[i + 1] == _LINE_BULLET:
                 formatted_lines.append('<ul>')
                 in_bullet_list = True
             else:
                 formatted_lines.append('</li>')
-            
-            i += 1
             continue
         
         # 불릿 목록 처리 (-, * 등)
-        bullet_match = re.match(r'^[-*]\s*(.+)', line)
-        if bullet_match:
-            content = bullet_match.group(1)
-            # 굵은 글씨 처리
-            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+        if kind == _LINE_BULLET:
+            content = matches[i].group(1)
             
             if in_bullet_list:
                 formatted_lines.append(f'<li>{content}</li>')
@@ -547,8 +639,6 @@ def format_ai_analysis_for_html(analysis_text: str) -> str:
                 formatted_lines.append('<ul>')
                 formatted_lines.append(f'<li>{content}</li>')
                 in_bullet_list = True
-            
-            i += 1
             continue
         
         # 일반 텍스트 처리
@@ -558,21 +648,10 @@ def format_ai_analysis_for_html(analysis_text: str) -> str:
             formatted_lines.append('</li>')  # 번호 항목 종료
             in_bullet_list = False
         
-        # 번호 리스트가 아닌 일반 텍스트면 번호 리스트도 종료
-        if in_numbered_list and not re.match(r'^(\d+)\.\s*(.+)', line):
-            # 다음 줄이 번호 항목인지 확인
-            next_is_numbered = False
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if re.match(r'^(\d+)\.\s*(.+)', next_line):
-                    next_is_numbered = True
-            
-            if not next_is_numbered:
-                formatted_lines.append('</ol>')
-                in_numbered_list = False
-        
-        # 굵은 글씨 처리
-        line = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', line)
+        # 다음 줄이 번호 항목이 아니면 번호 리스트도 종료
+        if in_numbered_list and not (i + 1 < line_count and kinds[i + 1] == _LINE_NUMBERED):
+            formatted_lines.append('</ol>')
+            in_numbered_list = False
         
         # 제목 처리 (### 등)
         if line.startswith('###'):
@@ -583,8 +662,6 @@ def format_ai_analysis_for_html(analysis_text: str) -> str:
             formatted_lines.append(f'<h2>{line[1:].strip()}</h2>')
         else:
             formatted_lines.append(f'<p>{line}</p>')
-        
-        i += 1
     
     # 마지막에 열린 리스트 태그 닫기
     if in_bullet_list:
@@ -595,47 +672,43 @@ def format_ai_analysis_for_html(analysis_text: str) -> str:
     
     return '\n'.join(formatted_lines)
 
-def create_template_data(land_data: Dict[str, Any], knowledge_analysis: str, policy_analysis: str, analyze_data: Dict[str, Any] = None) -> Dict[str, Any]:
+# analyze_data 미입력 시 사용하는 기본 분석 점수
+_DEFAULT_ANALYZE_DATA = MappingProxyType({
+    "입지조건": 75,
+    "인프라": 70,
+    "안정성": 65
+})
+
+def create_template_data(land_data: Dict[str, Any], knowledge_analysis: str, policy_analysis: str, analyze_data: Dict[str, Any] = None, policy_projects: Optional[List[Dict]] = _UNPARSED, current_date: datetime = None) -> Dict[str, Any]:
     """
     Jinja2 템플릿용 데이터 구조를 생성합니다.
+    policy_projects 가 주어지면 정책 응답을 다시 파싱하지 않습니다.
+    land_data 에는 '공시지가_formatted' 키가 직접 추가됩니다. (복사하지 않음)
     """
-    current_date = datetime.now()
-    
-    # 공시지가 포맷팅
-    gongsi_price = land_data.get('공시지가', 0)
-    if isinstance(gongsi_price, (int, float)):
-        gongsi_formatted = f"{gongsi_price:,}원"
-    else:
-        gongsi_formatted = str(gongsi_price)
+    if current_date is None:
+        current_date = datetime.now()
     
     # 토지 데이터에 포맷된 공시지가 추가
-    land_data_with_formatted = land_data.copy()
-    land_data_with_formatted['공시지가_formatted'] = gongsi_formatted
+    land_data['공시지가_formatted'] = _format_gongsi_price(land_data.get(_K_PRICE, 0))
     
     # 정책 데이터 파싱
-    print("🔍 정책 분석 응답 디버깅:")
-    print(f"   응답 타입: {type(policy_analysis)}")
-    print(f"   응답 길이: {len(str(policy_analysis))}")
-    print(f"   응답 미리보기: {str(policy_analysis)[:300]}...")
+    logger.debug("정책 분석 응답 - 타입: %s, 길이: %d, 미리보기: %.300s...",
+                 type(policy_analysis), len(str(policy_analysis)), policy_analysis)
     
-    policies = parse_policy_response_for_template(policy_analysis)
+    policies = parse_policy_response_for_template(policy_analysis, policy_projects)
     
     # AI 분석 결과 HTML 포맷팅
     ai_analysis_html = format_ai_analysis_for_html(knowledge_analysis)
     
     # 분기 계산
-    quarter = f"{current_date.year}년 {(current_date.month - 1) // 3 + 1}분기"
+    quarter = f"{current_date.year}년 {_MONTH_TO_QUARTER[current_date.month]}분기"
     
-    # analyze_data 처리 (기본값 설정)
+    # analyze_data 처리 (기본값 설정, 결과가 외부로 반환되므로 복사본 사용)
     if analyze_data is None:
-        analyze_data = {
-            "입지조건": 75,
-            "인프라": 70,
-            "안정성": 65
-        }
+        analyze_data = dict(_DEFAULT_ANALYZE_DATA)
     
     template_data = {
-        'land_data': land_data_with_formatted,
+        'land_data': land_data,
         'analyze_data': analyze_data,
         'ai_analysis': ai_analysis_html,
         'policies': policies,
@@ -650,9 +723,7 @@ def generate_html_report(template_data: Dict[str, Any]) -> str:
     Jinja2 템플릿을 사용하여 HTML 보고서를 생성합니다.
     """
     try:
-        # Jinja2 환경 설정
-        env = Environment(loader=FileSystemLoader('templates'))
-        template = env.get_template('web_report_template.html')
+        template = _JINJA_ENV.get_template('web_report_template.html')
         
         # 템플릿 렌더링
         html_content = template.render(**template_data)
@@ -686,7 +757,8 @@ def orchestrate_land_analysis(land_data_str: str) -> str:
     except Exception as e:
         return f"토지 분석 오케스트레이션 오류: {str(e)}\n입력 데이터: {land_data_str}"
 
-def render_html_report(user_query: str, analysis_result: Dict[str, Any], task_id: str, template_path: str = "template.html") -> str:
+def render_html_report(user_query: str, analysis_result: Dict[str, Any], task_id: str, template_path: str = "template.html",
+                       raise_on_error: bool = False) -> str:
     """
     분석 결과를 사용하여 HTML 보고서를 렌더링합니다.
     
@@ -694,14 +766,13 @@ def render_html_report(user_query: str, analysis_result: Dict[str, Any], task_id
         user_query: 사용자 쿼리 (토지 데이터)
         analysis_result: 분석 결과 딕셔너리
         template_path: HTML 템플릿 파일 경로
+        raise_on_error: True 이면 오류 HTML 대신 예외를 그대로 전달 (결과를 캐시하는 호출자용)
         
     Returns:
         렌더링된 HTML 문자열
     """
     try:
-        # Jinja2 환경 설정
-        env = Environment(loader=FileSystemLoader('templates'))
-        template = env.get_template(template_path)
+        template = _JINJA_ENV.get_template(template_path)
         
         # 템플릿 렌더링
         html_content = template.render(task_id=task_id, **analysis_result)
@@ -709,19 +780,49 @@ def render_html_report(user_query: str, analysis_result: Dict[str, Any], task_id
         return html_content
         
     except Exception as e:
+        if raise_on_error:
+            raise
         return f"<html><body><h1>HTML 보고서 생성 오류</h1><p>{str(e)}</p></body></html>"
 
-def run_land_analysis_inference(land_data_input, analyze_data_input=None) -> Dict[str, Any]:
+def _parse_land_data_str(land_data_str: str) -> Dict[str, Any]:
+    """
+    "'주소': '...', '지목': '대', ..." 형식의 문자열을 한 번의 정규식 스캔으로 딕셔너리로 변환합니다.
+    공시지가는 정수로 변환할 수 있으면 int 로 저장합니다.
+    """
+    land_data = {}
+    for match in _LAND_FIELD_RE.finditer(land_data_str):
+        key = match.group(1).strip()
+        value = match.group(2)
+        if value is None:
+            value = match.group(3)
+        land_data[_CANON_LAND_KEYS.get(key, key)] = value.strip()
+    
+    if _K_PRICE in land_data:
+        try:
+            land_data[_K_PRICE] = int(land_data[_K_PRICE])
+        except ValueError:
+            pass
+    
+    return land_data
+
+def _ignore_progress(progress: int, message: str) -> None:
+    pass
+
+def run_land_analysis_inference(land_data_input, analyze_data_input=None, progress_cb: Optional[Callable[[int, str], None]] = None) -> Dict[str, Any]:
     """
     토지 분석 추론을 실행하고 구조화된 결과를 반환합니다.
     
     Args:
         land_data_input: 토지 정보 (문자열 또는 딕셔너리)
+        progress_cb: 진행률(0~100)과 상태 메시지를 받는 콜백 (실행 스레드에서 호출됨)
         
     Returns:
         분석 결과 딕셔너리 (템플릿 렌더링용)
     """
+    report_progress = progress_cb or _ignore_progress
     try:
+        report_progress(10, "토지 데이터를 파싱하는 중...")
+        
         # 입력 데이터 타입에 따라 처리
         if isinstance(land_data_input, dict):
             # JSON 딕셔너리인 경우
@@ -731,53 +832,45 @@ def run_land_analysis_inference(land_data_input, analyze_data_input=None) -> Dic
         elif isinstance(land_data_input, str):
             # 기존 문자열 형태인 경우
             land_data_str = land_data_input
-            land_data = {}
-            clean_data = land_data_str.replace("'", "").strip()
-            
-            items = clean_data.split(', ')
-            for item in items:
-                if ':' in item:
-                    parts = item.split(':', 1)
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value = parts[1].strip()
-                        
-                        if key == '공시지가':
-                            try:
-                                value = int(value)
-                            except ValueError:
-                                pass
-                        
-                        land_data[key] = value
+            land_data = _parse_land_data_str(land_data_str)
         else:
             raise ValueError("지원하지 않는 데이터 형식입니다.")
         
-        if not land_data or '주소' not in land_data:
+        if not land_data or _K_ADDR not in land_data:
             raise ValueError("토지 데이터 파싱 오류: 주소 정보가 없습니다.")
         
-        print("🔍 토지 지식 분석 시작...")
-        knowledge_analysis = land_knowledge_analysis(land_data_str)
+        # 지식 분석과 정책 분석은 서로 독립적이므로 공용 스레드 풀에서 동시에 실행
+        logger.info("토지 지식 분석 시작...")
+        knowledge_future = _AGENT_EXECUTOR.submit(land_knowledge_analysis, land_data_str)
+        
+        logger.info("정책 분석 시작...")
+        policy_future = _AGENT_EXECUTOR.submit(_search_policies, land_data_str, str(land_data[_K_ADDR]))
+        report_progress(30, "AI 토지 분석을 수행하는 중...")
         
-        print("🏛️ 정책 분석 시작...")
-        policy_analysis = policy_search_analysis(land_data_str)
+        knowledge_analysis = knowledge_future.result()
+        report_progress(60, "관련 정책을 검색하는 중...")
+        policy_analysis = policy_future.result()
         
-        print("📋 분석 결과 구조화 중...")
+        logger.info("분석 결과 구조화 중...")
+        report_progress(80, "분석 결과를 정리하는 중...")
         
         # analyze_data 처리
         if analyze_data_input is None:
-            analyze_data = {
-                "입지조건": 75,
-                "인프라": 70,
-                "안정성": 65
-            }
+            analyze_data = dict(_DEFAULT_ANALYZE_DATA)
         else:
             analyze_data = analyze_data_input
         
+        # 보고서 작성 시각은 한 번만 계산하여 템플릿 데이터와 마크다운 보고서에서 공유
+        now = datetime.now()
+        
+        # 정책 JSON 은 한 번만 파싱하여 템플릿 데이터와 마크다운 보고서에서 공유
+        policy_projects = _parse_policy_projects(policy_analysis)
+        
         # 템플릿용 데이터 생성
-        template_data = create_template_data(land_data, knowledge_analysis, policy_analysis, analyze_data)
+        template_data = create_template_data(land_data, knowledge_analysis, policy_analysis, analyze_data, policy_projects, now)
         
         # 마크다운 보고서도 생성 (기존 호환성 유지)
-        markdown_report = create_korean_land_report(land_data, knowledge_analysis, policy_analysis)
+        markdown_report = create_korean_land_report(land_data, knowledge_analysis, policy_analysis, policy_projects, now)
         
         # 결과에 마크다운 보고서도 포함
         template_data['markdown_report'] = markdown_report
@@ -798,12 +891,13 @@ def run_land_analysis_inference(land_data_input, analyze_data_input=None) -> Dic
             'ai_analysis': f'<p>분석 중 오류가 발생했습니다: {str(e)}</p>',
             'policies': [],
             'analysis_date': current_date.strftime("%Y년 %m월 %d일 %H시 %M분"),
-            'analysis_quarter': f"{current_date.year}년 {(current_date.month - 1) // 3 + 1}분기",
+            'analysis_quarter': f"{current_date.year}년 {_MONTH_TO_QUARTER[current_date.month]}분기",
             'error': str(e)
         }
 
 def main():
     """메인 오케스트레이터 실행"""
+    logging.basicConfig(level=logging.INFO)
     
     # 테스트 데이터 (JSON 형식)
     test_land_data_json = {
@@ -843,9 +937,12 @@ def main():
             print(f"   - 정책 개수: {len(analysis_result.get('policies', []))}")
             print(f"   - 분석 날짜: {analysis_result.get('analysis_date', 'N/A')}")
         
+        # 보고서 파일명에 사용할 타임스탬프 (마크다운/HTML 공통)
+        report_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         # 2. 마크다운 보고서 저장 (기존 호환성)
         if 'markdown_report' in analysis_result:
-            md_filename = f"토지분석보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            md_filename = f"토지분석보고서_{report_timestamp}.md"
             with open(md_filename, "w", encoding="utf-8") as f:
                 f.write(analysis_result['markdown_report'])
             print(f"📄 마크다운 보고서 저장: {md_filename}")
@@ -854,15 +951,16 @@ def main():
         print("🎨 HTML 보고서 렌더링 중...")
         # JSON 데이터를 문자열로 변환하여 기존 템플릿과 호환
         land_data_str_for_template = ", ".join([f"'{k}': '{v}'" for k, v in test_land_data_json.items()])
-        report_html = render_html_report(land_data_str_for_template, analysis_result, "web_report_template.html")
+        report_html = render_html_report(land_data_str_for_template, analysis_result, report_timestamp, template_path="web_report_template.html")
         
         # 4. HTML 보고서 파일 저장
-        report_filename = f"토지분석보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(report_filename, "w", encoding="utf-8") as f:
-            f.write(str(report_html))
+        report_filename = f"토지분석보고서_{report_timestamp}.html"
+        report_bytes = report_html.encode("utf-8")
+        with open(report_filename, "wb") as f:
+            f.write(report_bytes)
         
         print(f"\n✅ Successfully generated report. Please open '{report_filename}' in your browser.")
-        print(f"📊 HTML 보고서 크기: {len(report_html):,} bytes")
+        print(f"📊 HTML 보고서 크기: {len(report_bytes):,} bytes")
         
         # 5. 결과 요약 출력
         print("\n📋 분석 결과 요약:")
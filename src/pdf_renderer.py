@@ -0,0 +1,12 @@
+"""
+PDF 렌더링 - WeasyPrint 전용 워커 프로세스에서 실행되는 함수
+
+ProcessPoolExecutor(spawn) 워커가 이 모듈만 import 하도록 분리되어 있어,
+워커 프로세스는 에이전트/서버 모듈 없이 WeasyPrint 만 로드합니다.
+"""
+
+from weasyprint import HTML
+
+def render_pdf(html_report: str) -> bytes:
+    """HTML 문자열을 PDF 바이트로 변환"""
+    return HTML(string=html_report).write_pdf()
@@ -1,16 +1,89 @@
 from strands import Agent, tool
-from strands_tools import retrieve
-from config import get_configured_model, get_agent_prompt, knowledge_base_config
-import os, sys
+from config import get_configured_model, get_agent_prompt
+import functools
+import os
 from dotenv import load_dotenv
-from typing import Optional, List, Dict, Any
+from typing import Optional
+import html
 import json
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from bs4 import BeautifulSoup
-import requests
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 모듈만 사용
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# NOTE: The public API key for bizinfo.go.kr is often rate-limited or
+# may require registration. 모듈 로드 시 한 번만 읽는다.
+_BIZINFO_API_KEY = os.getenv("BIZINFO_API_KEY", "")
+_api_key_warned = False
+
+# 정책 에이전트 모델/시스템 프롬프트 (모듈 로드 시 한 번만 준비)
+_POLICY_MODEL_ID = "apac.anthropic.claude-3-sonnet-20240229-v1:0"
+_POLICY_AGENT_PROMPT = get_agent_prompt('past_prompt')
+
+_BIZINFO_URL = "https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do"
+
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """
+    Bizinfo API 공용 세션 (호출마다 TCP/TLS 연결을 새로 맺지 않고 keep-alive 연결을 재사용)
+    requests 는 실제로 API 를 호출할 때 처음 import 하여 모듈 import 비용을 줄입니다.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+    ))
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    return session
+
+# 검색 결과 캐시: (result_count, category_id, tags) → JSON 문자열, 15분 TTL
+# API 키는 모듈 로드 시 한 번만 읽으므로 키를 교체하면 프로세스 재시작과 함께 캐시도 비워진다.
+_SEARCH_CACHE_TTL = 15 * 60
+_SEARCH_CACHE_MAXSIZE = 256
+_search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# 사업 요약(bsnsSumryCn) HTML → 텍스트 변환용 (태그 제거 후 공백 정리)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# search_bizinfo_projects 에서 허용하는 분류 코드 및 해시태그
+_VALID_CATS = frozenset({'01', '02', '03', '04', '05', '06', '07', '09'})
+_VALID_TAGS = frozenset({
+    '금융', '기술', '인력', '수출', '내수', '창업', '경영', '기타',
+    '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기',
+    '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주',
+})
+
+def _dumps_projects(projects: list) -> str:
+    """프로젝트 리스트를 공백 없는 JSON 문자열로 직렬화 (에이전트에 전달되는 토큰 수 절감)"""
+    if orjson is not None:
+        return orjson.dumps(projects).decode()
+    return json.dumps(projects, ensure_ascii=False, separators=(',', ':'))
+
+def _html_to_text(summary_html: str) -> str:
+    """HTML 조각에서 태그를 제거하고 엔티티를 풀어 한 줄 텍스트로 반환"""
+    if not summary_html:
+        return ""
+    return _WS_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", summary_html))).strip()
+
 @tool
 def search_bizinfo_projects(
     result_count: int = 10,
@@ -42,19 +115,37 @@ def search_bizinfo_projects(
         str: A JSON string containing a list of project objects. Returns an empty
             JSON array string '[]' if no projects are found or an error occurs.
     """
-    try:
-        # NOTE: The public API key for bizinfo.go.kr is often rate-limited or
-        # may require registration. This is a placeholder key.
-        api_key = os.getenv("BIZINFO_API_KEY", "")
-        if api_key == "":
-            print("Warning: BIZINFO_API_KEY is not set.")
-            sys.exit("Aborting due to API KEY being not available.")
-
+    # 잘못된 분류 코드/태그는 API 호출 없이 바로 빈 결과 반환
+    if category_id and category_id not in _VALID_CATS:
+        logger.warning("Invalid category_id: %s", category_id)
+        return "[]"
+    if tags:
+        bad = [t for t in (t.strip() for t in tags.split(',')) if t and t not in _VALID_TAGS]
+        if bad:
+            logger.warning("Invalid tags: %s", bad)
+            return "[]"
+
+    # API 키가 없으면 프로세스를 종료하지 않고 빈 결과 반환 (경고는 한 번만 기록)
+    if not _BIZINFO_API_KEY:
+        global _api_key_warned
+        if not _api_key_warned:
+            _api_key_warned = True
+            logger.warning("BIZINFO_API_KEY is not set. Bizinfo search will return no results.")
+        return "[]"
+
+    cache_key = (result_count, category_id, tags)
+    now = time.monotonic()
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            _search_cache.move_to_end(cache_key)
+            return cached[1]
+
+    import requests  # 예외 처리용 (첫 호출 이후에는 sys.modules 조회만 발생)
 
-
-        base_url = "https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do"
+    try:
         params = {
-            'crtfcKey': api_key,
+            'crtfcKey': _BIZINFO_API_KEY,
             'dataType': 'json',
             'searchCnt': str(result_count),
         }
@@ -63,13 +154,12 @@ def search_bizinfo_projects(
         if tags:
             params['hashtags'] = tags
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        print(f"--- [Tool] Calling Bizinfo API with params: {params} ---")
-        response = requests.get(base_url, headers=headers, params=params, timeout=15)
-        print(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            # crtfcKey 가 로그에 남지 않도록 제외
+            logger.debug("Calling Bizinfo API with params: %s",
+                         {k: v for k, v in params.items() if k != 'crtfcKey'})
+        response = _get_session().get(_BIZINFO_URL, params=params, timeout=15)
+        logger.debug("Bizinfo API response: %s", response)
         response.raise_for_status()
         raw_data = response.json()
         items = raw_data.get("jsonArray", [])
@@ -77,8 +167,7 @@ def search_bizinfo_projects(
         summarized_projects = []
         for item in items:
             summary_html = item.get("bsnsSumryCn", "")
-            soup = BeautifulSoup(summary_html, "html.parser")
-            clean_summary = soup.get_text(separator=' ', strip=True)
+            clean_summary = _html_to_text(summary_html)
 
             project = {
                 "projectName": item.get("pblancNm"),
@@ -90,17 +179,25 @@ def search_bizinfo_projects(
             summarized_projects.append(project)
 
         # The tool should return a string, so we serialize the list to a JSON string.
-        return json.dumps(summarized_projects, ensure_ascii=False, indent=2)
+        result = _dumps_projects(summarized_projects)
+
+        # 정상 응답만 캐시 (오류 시 반환하는 "[]" 는 캐시하지 않음)
+        with _search_cache_lock:
+            _search_cache[cache_key] = (now + _SEARCH_CACHE_TTL, result)
+            _search_cache.move_to_end(cache_key)
+            while len(_search_cache) > _SEARCH_CACHE_MAXSIZE:
+                _search_cache.popitem(last=False)
+        return result
 
     except requests.exceptions.RequestException as e:
-        print(f"API request failed: {e}")
+        logger.error("API request failed: %s", e)
         return "[]" # Return empty JSON array on error
     except Exception as e:
-        print(f"An error occurred in the tool: {e}")
+        logger.error("An error occurred in the tool: %s", e)
         return "[]" # Return empty JSON array on error
 
 @tool
-def policy_agent(query: str) -> List[Dict[str, Any]]:
+def policy_agent(query: str) -> str:
     """
     Agent Description: Bizinfo Project Finder
 
@@ -117,11 +214,10 @@ def policy_agent(query: str) -> List[Dict[str, Any]]:
         - Output: Returns a raw JSON string (str) representing a list of project objects. This data is intended for further processing by another agent (e.g., for rendering into a report). Returns an empty JSON array string '[]' if no projects are found.
     """
     try:
-        model = get_configured_model("apac.anthropic.claude-3-sonnet-20240229-v1:0")
-        agent_prompt = get_agent_prompt('past_prompt')
+        # Agent 는 대화 기록을 누적하므로 호출마다 새로 만들고, 모델과 프롬프트만 재사용
         agent = Agent(
-            model=model,
-            system_prompt=agent_prompt,
+            model=get_configured_model(_POLICY_MODEL_ID),
+            system_prompt=_POLICY_AGENT_PROMPT,
             tools=[search_bizinfo_projects]
         )
 
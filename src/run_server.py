@@ -41,7 +41,7 @@ def check_dependencies():
     if missing_modules:
         print(f"\n⚠️ 누락된 모듈: {', '.join(missing_modules)}")
         print("다음 명령어로 설치하세요:")
-        print("pip install -r requirements_fastapi.txt")
+        print("pip install -r requirements.txt")
         return False
     
     return True
@@ -65,13 +65,19 @@ def main():
     print("=" * 50)
     
     # FastAPI 서버 실행
+    # RELOAD=1 은 개발용 (파일 변경 감시). 운영에서는 기본값(off) 사용
+    # WORKERS 를 늘리면 프로세스마다 analysis_tasks 가 따로 생기므로,
+    # 작업 상태를 외부 저장소로 옮기기 전에는 1 로 유지해야 상태 조회가 일관됨
+    # loop/http 는 기본값(auto)으로 두어 uvloop/httptools 가 설치되어 있으면 사용하고,
+    # 없는 환경(Windows 등)에서는 asyncio/h11 로 동작
     import uvicorn
     uvicorn.run(
         "fastapi_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="debug"
+        reload=os.getenv("RELOAD") == "1",
+        workers=int(os.getenv("WORKERS", "1")),
+        log_level=os.getenv("LOG_LEVEL", "info")
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 애플리케이션 모듈은 src/ 에서 최상위 모듈로 import 됨
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("strands")
+main_orchestrator = pytest.importorskip("main_orchestrator")
+
+_tool_cache_key = main_orchestrator._tool_cache_key
+
+LAND = "'주소': '대구광역시 중구 동인동1가 2-1', '지목': '대', '공시지가': 3735000"
+
+
+def test_distinct_addresses_have_distinct_keys():
+    other = "'주소': '대구광역시 중구 동인동1가 2-2', '지목': '대', '공시지가': 3735000"
+    assert _tool_cache_key('land_knowledge_analysis', LAND) != _tool_cache_key('land_knowledge_analysis', other)
+
+
+def test_whitespace_inside_values_is_significant():
+    spaced = "'주소': '대구광역시 중구 동인동 1가 2-1', '지목': '대', '공시지가': 3735000"
+    assert _tool_cache_key('land_knowledge_analysis', LAND) != _tool_cache_key('land_knowledge_analysis', spaced)
+
+
+def test_separator_spacing_and_quoting_are_ignored():
+    reformatted = "'주소':'대구광역시 중구 동인동1가 2-1' ,  '지목' : 대, '공시지가': '3735000'"
+    assert _tool_cache_key('land_knowledge_analysis', LAND) == _tool_cache_key('land_knowledge_analysis', reformatted)
+
+
+def test_tool_name_is_part_of_key():
+    assert _tool_cache_key('land_knowledge_analysis', LAND) != _tool_cache_key('policy_search_analysis', LAND)